@@ -10,10 +10,20 @@ import json
 def merge_dicts(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     return {**a, **b}
 
+
+def merge_data(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    # Analysts run concurrently, so merge their signals instead of letting
+    # the last writer replace the whole analyst_signals dict.
+    merged = {**a, **b}
+    merged["analyst_signals"] = merge_dicts(
+        a.get("analyst_signals", {}), b.get("analyst_signals", {})
+    )
+    return merged
+
 # Define agent state
 class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
-    data: Annotated[Dict[str, Any], merge_dicts]
+    data: Annotated[Dict[str, Any], merge_data]
     metadata: Annotated[Dict[str, Any], merge_dicts]
 
 
@@ -1,40 +1,53 @@
 from pathlib import Path
 from dotenv import load_dotenv
+import asyncio
+import functools
 import os
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as YamlLoader
+
 # Load the global .env file first, then the local one if it exists
-home = str(Path.home())
-load_dotenv(f"{home}/.env")
-load_dotenv(Path(__file__).parent.parent / ".env")  # Load local .env if it exists
-
-from langchain_core.messages import HumanMessage
-from langgraph.graph import END, StateGraph
-from colorama import Fore, Back, Style, init
-import questionary
-
-from agents.fundamentals import fundamentals_agent
-from agents.portfolio_manager import portfolio_management_agent
-from agents.technicals import technical_analyst_agent
-from agents.risk_manager import risk_management_agent
-from agents.sentiment import sentiment_agent
-from graph.state import AgentState
-from agents.valuation import valuation_agent
-from utils.display import print_trading_output
+for env_path in (Path.home() / ".env", Path(__file__).resolve().parent.parent / ".env"):
+    if env_path.is_file():
+        load_dotenv(env_path, override=False)
 
 import argparse
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from tabulate import tabulate
 
-init(autoreset=True)
+try:
+    from orjson import loads as _loads  # faster parsing of the LLM responses when available
+except ImportError:
+    from json import loads as _loads
+
+# langchain, langgraph, the agents and the CLI helpers are slow to import, so
+# they are imported where they are used rather than here. This keeps --help
+# and argument errors fast.
+
+# Display names of the analysts that can be selected, in menu order
+ANALYST_DISPLAY_NAMES = {
+    "technical_analyst": "Technical Analyst",
+    "fundamentals_analyst": "Fundamentals Analyst",
+    "sentiment_analyst": "Sentiment Analyst",
+    "valuation_analyst": "Valuation Analyst",
+}
+
+
+def parse_date(value: str) -> datetime:
+    """argparse type for YYYY-MM-DD dates."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
 
 
 def parse_hedge_fund_response(response):
-    import json
     try:
-        return json.loads(response)
-    except:
+        return _loads(response)
+    except (ValueError, TypeError):
         print(f"Error parsing response: {response}")
         return None
 
@@ -46,66 +59,160 @@ def run_hedge_fund(
     portfolio: dict,
     show_reasoning: bool = False,
     selected_analysts: list = None,
+    show_progress: bool = False,
 ):
-    # Create a new workflow if analysts are customized
+    agent = get_agent(selected_analysts)
+    final_state = None
+    for mode, event in agent.stream(
+        build_initial_state(ticker, start_date, end_date, portfolio, show_reasoning),
+        stream_mode=["updates", "values"],
+    ):
+        final_state = handle_stream_event(ticker, mode, event, final_state, show_progress)
+    return build_result(final_state)
+
+
+async def arun_hedge_fund(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    portfolio: dict,
+    show_reasoning: bool = False,
+    selected_analysts: list = None,
+    show_progress: bool = False,
+):
+    """Async variant of run_hedge_fund so several tickers can overlap their API calls."""
+    agent = get_agent(selected_analysts)
+    final_state = None
+    async for mode, event in agent.astream(
+        build_initial_state(ticker, start_date, end_date, portfolio, show_reasoning),
+        stream_mode=["updates", "values"],
+    ):
+        final_state = handle_stream_event(ticker, mode, event, final_state, show_progress)
+    return build_result(final_state)
+
+
+def handle_stream_event(ticker: str, mode: str, event: dict, final_state, show_progress: bool):
+    """Handle one (mode, event) pair from the graph stream and return the latest state."""
+    if mode == "values":
+        return event
+    if show_progress:
+        print_progress(ticker, event)
+    return final_state
+
+
+def print_progress(ticker: str, update: dict):
+    # Report each agent as soon as it finishes instead of waiting for the whole graph
+    for node_name in update:
+        if node_name != "start_node":
+            print(f"{ticker}: {node_name.replace('_', ' ')} done")
+
+
+def get_agent(selected_analysts: list = None):
+    """Return the compiled workflow for the selected analysts (all analysts if None)."""
     if selected_analysts is not None:
-        workflow = create_workflow(selected_analysts)
-        agent = workflow.compile()
-    else:
-        agent = app
-
-    final_state = agent.invoke(
-        {
-            "messages": [
-                HumanMessage(
-                    content="Make a trading decision based on the provided data.",
-                )
-            ],
-            "data": {
-                "ticker": ticker,
-                "portfolio": portfolio,
-                "start_date": start_date,
-                "end_date": end_date,
-                "analyst_signals": {},
-            },
-            "metadata": {
-                "show_reasoning": show_reasoning,
-            },
+        if not selected_analysts:
+            raise ValueError("At least one analyst must be selected")
+        unknown = set(selected_analysts) - get_analyst_nodes().keys()
+        if unknown:
+            raise ValueError(f"Unknown analysts: {', '.join(sorted(unknown))}")
+    return compile_workflow(tuple(sorted(selected_analysts)) if selected_analysts else ())
+
+
+@functools.lru_cache(maxsize=16)
+def compile_workflow(selected_analysts: tuple):
+    # Compiling the graph is not free, so build it once per analyst selection
+    # instead of once per ticker (or once per day in the backtester).
+    workflow = create_workflow(list(selected_analysts) or None)
+    return workflow.compile()
+
+
+@functools.lru_cache(maxsize=None)
+def get_analyst_nodes():
+    """Map each analyst to its (node name, node function), built once on first use."""
+    from agents.fundamentals import fundamentals_agent
+    from agents.technicals import technical_analyst_agent
+    from agents.sentiment import sentiment_agent
+    from agents.valuation import valuation_agent
+
+    return {
+        "technical_analyst": ("technical_analyst_agent", technical_analyst_agent),
+        "fundamentals_analyst": ("fundamentals_agent", fundamentals_agent),
+        "sentiment_analyst": ("sentiment_agent", sentiment_agent),
+        "valuation_analyst": ("valuation_agent", valuation_agent),
+    }
+
+
+def build_initial_state(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    portfolio: dict,
+    show_reasoning: bool = False,
+):
+    from langchain_core.messages import HumanMessage
+
+    return {
+        "messages": [
+            HumanMessage(
+                content="Make a trading decision based on the provided data.",
+            )
+        ],
+        "data": {
+            "ticker": ticker,
+            "portfolio": portfolio,
+            "start_date": start_date,
+            "end_date": end_date,
+            "analyst_signals": {},
         },
-    )
+        "metadata": {
+            "show_reasoning": show_reasoning,
+        },
+    }
+
+
+def build_result(final_state):
     return {
         "decision": parse_hedge_fund_response(final_state["messages"][-1].content),
         "analyst_signals": final_state["data"]["analyst_signals"],
     }
 
 
-def start(state: AgentState):
+def start(state):
     """Initialize the workflow with the input message."""
     return state
 
 
 def create_workflow(selected_analysts=None):
     """Create the workflow with selected analysts."""
+    from langgraph.graph import END, StateGraph
+    from langgraph.types import Send
+
+    from agents.portfolio_manager import portfolio_management_agent
+    from agents.risk_manager import risk_management_agent
+    from graph.state import AgentState
+
     workflow = StateGraph(AgentState)
     workflow.add_node("start_node", start)
     
+    # Dictionary of all available analysts
+    analyst_nodes = get_analyst_nodes()
+
     # Default to all analysts if none selected
     if selected_analysts is None:
-        selected_analysts = ["technical_analyst", "fundamentals_analyst", "sentiment_analyst", "valuation_analyst"]
-    
-    # Dictionary of all available analysts
-    analyst_nodes = {
-        "technical_analyst": ("technical_analyst_agent", technical_analyst_agent),
-        "fundamentals_analyst": ("fundamentals_agent", fundamentals_agent),
-        "sentiment_analyst": ("sentiment_agent", sentiment_agent),
-        "valuation_analyst": ("valuation_agent", valuation_agent),
-    }
+        selected_analysts = list(analyst_nodes)
     
     # Add selected analyst nodes
     for analyst_key in selected_analysts:
         node_name, node_func = analyst_nodes[analyst_key]
         workflow.add_node(node_name, node_func)
-        workflow.add_edge("start_node", node_name)
+
+    # Fan out to the selected analysts so they run concurrently
+    analyst_node_names = [analyst_nodes[analyst_key][0] for analyst_key in selected_analysts]
+
+    def fan_out(state: AgentState):
+        return [Send(node_name, state) for node_name in analyst_node_names]
+
+    workflow.add_conditional_edges("start_node", fan_out, analyst_node_names)
     
     # Always add risk and portfolio management
     workflow.add_node("risk_management_agent", risk_management_agent)
@@ -122,9 +229,6 @@ def create_workflow(selected_analysts=None):
     workflow.set_entry_point("start_node")
     return workflow
 
-# # Initialize app as None - it will be set in __main__
-# app = None
-
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run the hedge fund trading system")
@@ -133,11 +237,11 @@ if __name__ == "__main__":
     group.add_argument("--config", type=str, help="Path to YAML configuration file")
     parser.add_argument(
         "--start-date",
-        type=str,
+        type=parse_date,
         help="Start date (YYYY-MM-DD). Defaults to 3 months before end date",
     )
     parser.add_argument(
-        "--end-date", type=str, help="End date (YYYY-MM-DD). Defaults to today"
+        "--end-date", type=parse_date, help="End date (YYYY-MM-DD). Defaults to today"
     )
     parser.add_argument(
         "--show-reasoning", action="store_true", help="Show reasoning from each agent"
@@ -145,30 +249,75 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Number of tickers processed concurrently
+    try:
+        max_parallel = int(os.getenv("HEDGE_MAX_PARALLEL", "4"))
+    except ValueError:
+        max_parallel = 0
+    if max_parallel < 1:
+        parser.error("HEDGE_MAX_PARALLEL must be a positive integer")
+    # Agent reasoning is printed without a ticker label, so run tickers one at
+    # a time when it is shown to keep each ticker's output together
+    if args.show_reasoning:
+        max_parallel = 1
+
+    from colorama import Fore, Style, init
+    from dateutil.relativedelta import relativedelta
+    import questionary
+
+    from utils.display import print_trading_output
+
+    init(autoreset=True)
+
     # Load configuration from YAML if provided
     if args.config:
         with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlLoader)
+        if not isinstance(config, dict):
+            parser.error(f"{args.config} must contain a YAML mapping")
         positions = config.get('positions', {})
+        # Fail fast on a malformed config rather than partway through the tickers
+        if not isinstance(positions, dict) or not all(isinstance(v, dict) for v in positions.values()):
+            parser.error("config.positions must be a mapping of ticker -> {stock: number}")
+        portfolio_config = config.get('portfolio', {})
+        if not isinstance(portfolio_config, dict):
+            parser.error("config.portfolio must be a mapping, e.g. {cash: number}")
+        cash = portfolio_config.get('cash', 100000.0)
+        if isinstance(cash, bool) or not isinstance(cash, (int, float)):
+            parser.error(f"config.portfolio.cash must be a number, got {cash!r}")
+        # Normalize ticker case, refusing configs where e.g. aapl and AAPL
+        # would silently overwrite each other's position
+        normalized_positions = {}
+        for ticker, position in positions.items():
+            key = str(ticker).upper()
+            if key in normalized_positions:
+                parser.error(f"config.positions lists {key} more than once (ticker case is ignored)")
+            normalized_positions[key] = position
+        positions = normalized_positions
         tickers = list(positions.keys())
         base_portfolio = {
-            "cash": config.get('portfolio', {}).get('cash', 100000.0),
+            "cash": cash,
         }
     else:
-        tickers = args.tickers
+        # Drop duplicate tickers (case-insensitively), keeping the given order
+        tickers = list(dict.fromkeys(ticker.upper() for ticker in args.tickers))
         base_portfolio = {
             "cash": 100000.0,
         }
         positions = {ticker: {"stock": 0} for ticker in tickers}
 
+    # Starting stock position for each ticker
+    stocks = {ticker: positions[ticker].get("stock", 0) for ticker in tickers}
+    for ticker, stock in stocks.items():
+        if isinstance(stock, bool) or not isinstance(stock, (int, float)):
+            parser.error(f"config.positions.{ticker}.stock must be a number, got {stock!r}")
+
     selected_analysts = None
     choices = questionary.checkbox(
         "Select your AI analysts.",
         choices=[
-            questionary.Choice("Technical Analyst", value="technical_analyst"),
-            questionary.Choice("Fundamentals Analyst", value="fundamentals_analyst"),
-            questionary.Choice("Sentiment Analyst", value="sentiment_analyst"),
-            questionary.Choice("Valuation Analyst", value="valuation_analyst"),
+            questionary.Choice(name, value=key)
+            for key, name in ANALYST_DISPLAY_NAMES.items()
         ],
         instruction="\n\nInstructions: \n1. Press Space to select/unselect analysts.\n2. Press 'a' to select/unselect all.\n3. Press Enter when done to run the hedge fund.\n",
         validate=lambda x: len(x) > 0 or "You must select at least one analyst.",
@@ -185,54 +334,60 @@ if __name__ == "__main__":
         selected_analysts = None
     else:
         selected_analysts = choices
-        print(f"\nSelected analysts: {', '.join(Fore.GREEN + choice.title().replace('_', ' ') + Style.RESET_ALL for choice in choices)}")
-
-    # Create the workflow with selected analysts
-    workflow = create_workflow(selected_analysts)
-    app = workflow.compile()
-
-    # Validate dates if provided
-    if args.start_date:
-        try:
-            datetime.strptime(args.start_date, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError("Start date must be in YYYY-MM-DD format")
-
-    if args.end_date:
-        try:
-            datetime.strptime(args.end_date, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError("End date must be in YYYY-MM-DD format")
-
-    # Set the start and end dates
-    end_date = args.end_date or datetime.now().strftime("%Y-%m-%d")
-    if not args.start_date:
-        # Calculate 3 months before end_date
-        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-        start_date = (end_date_obj - relativedelta(months=3)).strftime("%Y-%m-%d")
-    else:
-        start_date = args.start_date
+        print(f"\nSelected analysts: {', '.join(f'{Fore.GREEN}{ANALYST_DISPLAY_NAMES[choice]}{Style.RESET_ALL}' for choice in choices)}")
+
+    # Set the start and end dates, defaulting to the 3 months before end date.
+    # The agents take YYYY-MM-DD strings.
+    end_dt = args.end_date or datetime.now()
+    start_dt = args.start_date or (end_dt - relativedelta(months=3))
+    end_date = end_dt.strftime("%Y-%m-%d")
+    start_date = start_dt.strftime("%Y-%m-%d")
+
+    # Tickers run one at a time when max_parallel is 1, so their header can be
+    # printed up front and any reasoning output appears under it
+    serial = max_parallel == 1
 
-    # Process each ticker
-    for ticker in tickers:
+    def print_ticker_header(ticker):
         print(f"\n{Fore.CYAN}Analyzing {ticker}{Style.RESET_ALL}")
         print("=" * 50)
-        
-        # Create portfolio for this ticker
-        portfolio = base_portfolio.copy()
-        portfolio["stock"] = positions[ticker].get("stock", 0)
-        
-        # Run the hedge fund
-        try:
-
-            result = run_hedge_fund(
-                ticker=ticker,
-                start_date=start_date,
-                end_date=end_date,
-                portfolio=portfolio,
-                show_reasoning=args.show_reasoning,
-                selected_analysts=selected_analysts,
-            )
-            print_trading_output(result)
-        except Exception as e:
-            print(f"{Fore.RED}Error processing {ticker}: {e}{Style.RESET_ALL}")
\ No newline at end of file
+
+    async def run_all():
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run_one(ticker):
+            # Create portfolio for this ticker
+            portfolio = {**base_portfolio, "stock": stocks[ticker]}
+
+            # Run the hedge fund
+            async with semaphore:
+                if serial:
+                    print_ticker_header(ticker)
+                try:
+                    result = await arun_hedge_fund(
+                        ticker=ticker,
+                        start_date=start_date,
+                        end_date=end_date,
+                        portfolio=portfolio,
+                        show_reasoning=args.show_reasoning,
+                        selected_analysts=selected_analysts,
+                        show_progress=True,
+                    )
+                except Exception as e:
+                    result = e
+
+            # Print each ticker's decision as soon as it is ready
+            if not serial:
+                print_ticker_header(ticker)
+            if isinstance(result, Exception):
+                print(f"{Fore.RED}Error processing {ticker}: {result}{Style.RESET_ALL}")
+            else:
+                print_trading_output(result)
+
+        return await asyncio.gather(
+            *(run_one(ticker) for ticker in tickers), return_exceptions=True
+        )
+
+    # run_one reports its own errors, so only cancelled runs are left here
+    for ticker, outcome in zip(tickers, asyncio.run(run_all())):
+        if isinstance(outcome, BaseException):
+            print(f"{Fore.RED}Error processing {ticker}: {outcome!r}{Style.RESET_ALL}")
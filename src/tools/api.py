@@ -1,3 +1,5 @@
+import copy
+import functools
 import os
 from typing import Dict, Any, List
 import pandas as pd
@@ -5,6 +7,16 @@ import requests
 
 import requests
 
+# Responses are cached for the lifetime of the process so that repeated
+# analyst runs for the same ticker and dates (several tickers sharing a
+# session, the agents and the backtester fetching the same prices) do not
+# hit the API again. Failed requests raise and are therefore never cached.
+# The cached functions are private and always called with positional
+# arguments, so keyword and positional calls share a cache entry, and the
+# public wrappers return copies so callers cannot alter the cached data.
+API_CACHE_SIZE = 256
+
+
 def get_financial_metrics(
     ticker: str,
     report_period: str,
@@ -12,6 +24,15 @@ def get_financial_metrics(
     limit: int = 1
 ) -> List[Dict[str, Any]]:
     """Fetch financial metrics from the API."""
+    return copy.deepcopy(_get_financial_metrics(ticker, report_period, period, limit))
+
+@functools.lru_cache(maxsize=API_CACHE_SIZE)
+def _get_financial_metrics(
+    ticker: str,
+    report_period: str,
+    period: str,
+    limit: int
+) -> List[Dict[str, Any]]:
     headers = {}
     if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
         headers["X-API-KEY"] = api_key
@@ -41,6 +62,15 @@ def search_line_items(
     limit: int = 1
 ) -> List[Dict[str, Any]]:
     """Fetch cash flow statements from the API."""
+    return copy.deepcopy(_search_line_items(ticker, tuple(line_items), period, limit))
+
+@functools.lru_cache(maxsize=API_CACHE_SIZE)
+def _search_line_items(
+    ticker: str,
+    line_items: tuple,
+    period: str,
+    limit: int
+) -> List[Dict[str, Any]]:
     headers = {}
     if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
         headers["X-API-KEY"] = api_key
@@ -49,7 +79,7 @@ def search_line_items(
 
     body = {
         "tickers": [ticker],
-        "line_items": line_items,
+        "line_items": list(line_items),
         "period": period,
         "limit": limit
     }
@@ -72,6 +102,14 @@ def get_insider_trades(
     """
     Fetch insider trades for a given ticker and date range.
     """
+    return copy.deepcopy(_get_insider_trades(ticker, end_date, limit))
+
+@functools.lru_cache(maxsize=API_CACHE_SIZE)
+def _get_insider_trades(
+    ticker: str,
+    end_date: str,
+    limit: int,
+) -> List[Dict[str, Any]]:
     headers = {}
     if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
         headers["X-API-KEY"] = api_key
@@ -97,6 +135,12 @@ def get_market_cap(
     ticker: str,
 ) -> List[Dict[str, Any]]:
     """Fetch market cap from the API."""
+    return copy.deepcopy(_get_market_cap(ticker))
+
+@functools.lru_cache(maxsize=API_CACHE_SIZE)
+def _get_market_cap(
+    ticker: str,
+) -> List[Dict[str, Any]]:
     headers = {}
     if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
         headers["X-API-KEY"] = api_key
@@ -123,6 +167,14 @@ def get_prices(
     end_date: str
 ) -> List[Dict[str, Any]]:
     """Fetch price data from the API."""
+    return copy.deepcopy(_get_prices(ticker, start_date, end_date))
+
+@functools.lru_cache(maxsize=API_CACHE_SIZE)
+def _get_prices(
+    ticker: str,
+    start_date: str,
+    end_date: str
+) -> List[Dict[str, Any]]:
     headers = {}
     if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
         headers["X-API-KEY"] = api_key